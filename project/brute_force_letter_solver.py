@@ -1,8 +1,18 @@
 import argparse
+import hashlib
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
 import time
 from collections import Counter
-from typing import List, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from pathlib import Path
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Optional third‑party resources
@@ -28,9 +38,33 @@ try:                                         # 3️⃣ PyEnchant for spell‑che
 except (ImportError, AttributeError, enchant.errors.DictNotFoundError):
     _ENCHANT_DICT = None
 
+try:                                         # 4️⃣ Numba for the DFS kernel
+    from numba import njit
+
+    _USE_NUMBA = True
+except ImportError:
+    _USE_NUMBA = False
+
+    def njit(*args, **kwargs):               # no‑op stand‑in: run as Python
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 # ─── CONFIG ──────────────────────────────────────────────────────────────────
 MIN_WORD_LEN = 2           # ignore 1‑letter words outright
 TIMEOUT_SEC   = 15         # default DFS wall clock limit
+DFS_SLICE     = 1 << 17    # kernel steps between wall‑clock checks
+PARALLEL_AFTER_SEC = 1.0   # go multi‑process if the DFS runs longer than this
+
+# Encoded dictionaries are cached here as memory‑mappable .npy files
+CACHE_DIR = Path(
+    os.environ.get("LETTER_SOLVER_CACHE", Path.home() / ".cache" / "letter_solver")
+)
+_CACHE_FORMAT = 1          # bump when the WordTable layout changes
+
+# in‑process memo of loaded dictionaries / tables, keyed by source
+_DICT_CACHE: dict[Tuple, Tuple[str, ...]] = {}
+_TABLE_CACHE: dict[Tuple, "WordTable"] = {}
 
 # Scrabble‑legal 2‑letter words (North‑American list, no abbreviations)
 ALLOWED_TWO_LETTERS = {
@@ -44,6 +78,8 @@ ALLOWED_TWO_LETTERS = {
     "XI","XU","YA","YE","YO","YU","ZA"
 }
 
+ALPHABET_SIZE = 26         # letter vectors are indexed by ord(ch) - 65
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Logging helpers
 # ──────────────────────────────────────────────────────────────────────────────
@@ -58,6 +94,7 @@ def _configure_logging(verbose: bool = False) -> None:
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%H:%M:%S",
     )
+    logging.getLogger("numba").setLevel(logging.WARNING)  # JIT internals are noisy
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -88,6 +125,9 @@ def load_dictionary(
     SystemExit
         If no dictionary source is available.
     """
+    key = _dictionary_source(path, freq_limit)
+    if key in _DICT_CACHE:
+        return list(_DICT_CACHE[key])
     t0 = time.perf_counter()
 
     if _USE_ENGLISH_WORDS:
@@ -116,6 +156,7 @@ def load_dictionary(
             raise SystemExit(msg) from exc
 
     _LOG.info("Loaded %d words (%.1f s)", len(words), time.perf_counter() - t0)
+    _DICT_CACHE[key] = tuple(words)
     return words
 
 
@@ -130,38 +171,511 @@ def is_valid_word(word: str) -> bool:
     return _ENCHANT_DICT.check(word) if _ENCHANT_DICT else True
 
 
+# ─── LETTER VECTORS ──────────────────────────────────────────────────────────
+def encode_words(words: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(word_vecs, word_lens)`` for uppercase ASCII *words*.
+
+    ``word_vecs[i]`` is the length‑26 ``int8`` letter histogram of
+    ``words[i]`` and ``word_lens[i]`` its length.
+    """
+    n = len(words)
+    word_vecs = np.zeros((n, ALPHABET_SIZE), dtype=np.int8)
+    word_lens = np.fromiter((len(w) for w in words), dtype=np.int32, count=n)
+    if n:
+        codes = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8) - 65
+        rows = np.repeat(np.arange(n), word_lens)
+        np.add.at(word_vecs, (rows, codes), 1)
+    return word_vecs, word_lens
+
+
+def pool_vector(letter_counts: Counter) -> np.ndarray:
+    """Return *letter_counts* as a length‑26 ``int8`` vector (A–Z only)."""
+    pool = np.zeros(ALPHABET_SIZE, dtype=np.int8)
+    for ch, c in letter_counts.items():
+        if "A" <= ch <= "Z":
+            pool[ord(ch) - 65] = min(c, 127)
+    return pool
+
+
+def letter_masks(word_vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(word_mask, has_dupes)`` for the rows of *word_vecs*.
+
+    ``word_mask`` sets bit ``ord(ch) - 65`` for every letter a word uses, so a
+    word is buildable only if ``word_mask & ~pool_mask == 0``; for words
+    without repeated letters (``~has_dupes``) that test is also sufficient.
+    """
+    bits = np.left_shift(np.uint32(1), np.arange(ALPHABET_SIZE, dtype=np.uint32))
+    word_mask = np.bitwise_or.reduce(
+        np.where(word_vecs > 0, bits, np.uint32(0)), axis=1
+    ).astype(np.uint32)
+    has_dupes = (word_vecs > 1).any(axis=1)
+    return word_mask, has_dupes
+
+
+def _letter_index(
+    word_vecs: np.ndarray,
+    pool: np.ndarray | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return a CSR index ``(letter_ptr, letter_idx)`` of the distinct letters
+    in each word: word *i* uses letters ``letter_idx[letter_ptr[i]:letter_ptr[i + 1]]``.
+
+    Given *pool*, each word's letters are listed tightest first (least
+    spare supply after the word takes its share), so a count check that
+    walks them in order usually fails on the first letter.
+    """
+    rows, cols = np.nonzero(word_vecs)
+    if pool is not None:
+        headroom = pool[cols].astype(np.int16) - word_vecs[rows, cols]
+        order = np.lexsort((headroom, rows))
+        rows, cols = rows[order], cols[order]
+    letter_ptr = np.zeros(len(word_vecs) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(word_vecs)), out=letter_ptr[1:])
+    return letter_ptr, cols.astype(np.int32)
+
+
+class WordTable(NamedTuple):
+    """Dictionary words plus their letter arrays, built once per dictionary."""
+
+    words: List[str]
+    vecs: np.ndarray        # (n, 26) int8 letter histograms
+    lens: np.ndarray        # (n,) int32 word lengths
+    mask: np.ndarray        # (n,) uint32 letter bitsets
+    has_dupes: np.ndarray   # (n,) bool – some letter repeats
+    eligible: np.ndarray    # (n,) bool – passes MIN_WORD_LEN & 2‑letter whitelist
+
+
+def build_word_table(words: Sequence[str]) -> WordTable:
+    """
+    Encode *words* (uppercase) into a :class:`WordTable`.
+
+    Words containing anything other than ASCII ``A``–``Z`` can never be
+    built from a letter pool and are dropped here.
+    """
+    words = [w for w in words if w.isascii() and w.isalpha()]
+    vecs, lens = encode_words(words)
+    mask, has_dupes = letter_masks(vecs)
+    two_letter_ok = np.fromiter(
+        (len(w) != 2 or w in ALLOWED_TWO_LETTERS for w in words),
+        dtype=bool,
+        count=len(words),
+    )
+    eligible = (lens >= MIN_WORD_LEN) & two_letter_ok
+    return WordTable(words, vecs, lens, mask, has_dupes, eligible)
+
+
+# ─── WORD TABLE CACHE ────────────────────────────────────────────────────────
+def _dictionary_source(path: str, freq_limit: int) -> Tuple:
+    """Identify the source :func:`load_dictionary` will read, for cache keys."""
+    if _USE_ENGLISH_WORDS:
+        return ("english-words", metadata.version("english-words"))
+    if _USE_WORDFREQ:
+        return ("wordfreq", metadata.version("wordfreq"), freq_limit)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ("file", path)
+    return ("file", os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+def _table_key(path: str, freq_limit: int) -> Tuple:
+    """Everything the encoded table depends on, including the CONFIG knobs."""
+    return (
+        MIN_WORD_LEN,
+        tuple(sorted(ALLOWED_TWO_LETTERS)),
+        _dictionary_source(path, freq_limit),
+    )
+
+
+def _table_cache_dir(key: Tuple) -> Path:
+    key = (_CACHE_FORMAT, *key)
+    return CACHE_DIR / hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+
+
+def _read_table_cache(cache: Path) -> WordTable | None:
+    """Return the cached table in *cache* (arrays memory‑mapped), if present."""
+    try:
+        blob = np.load(cache / "words.npy", mmap_mode="r")
+        arrays = {
+            f: np.load(cache / f"{f}.npy", mmap_mode="r")
+            for f in WordTable._fields[1:]
+        }
+    except (OSError, ValueError):
+        return None
+    words = blob.tobytes().decode("ascii").split("\n") if blob.size else []
+    return WordTable(words, **arrays)
+
+
+def _write_table_cache(cache: Path, table: WordTable) -> None:
+    """Persist *table* under *cache*; failures only cost a rebuild next time."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=cache.parent))
+    except OSError as exc:
+        _LOG.warning("Could not create dictionary cache in %s: %s", cache.parent, exc)
+        return
+    try:
+        blob = np.frombuffer("\n".join(table.words).encode("ascii"), dtype=np.uint8)
+        np.save(tmp / "words.npy", blob)
+        for f in WordTable._fields[1:]:
+            np.save(tmp / f"{f}.npy", getattr(table, f))
+        os.replace(tmp, cache)
+    except OSError as exc:
+        _LOG.warning("Could not write dictionary cache %s: %s", cache, exc)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_word_table(
+    path: str = "/usr/share/dict/words",
+    freq_limit: int = 200_000,
+    use_cache: bool = True,
+) -> WordTable:
+    """
+    Load the dictionary (see :func:`load_dictionary`) and encode it.
+
+    With *use_cache* the encoded table is memory‑mapped from
+    :data:`CACHE_DIR`, keyed by dictionary source, version/size, *freq_limit*,
+    :data:`MIN_WORD_LEN` and :data:`ALLOWED_TWO_LETTERS`; on a miss it is built and written there.
+    Either way it is kept for later calls in the same process.
+    """
+    key = _table_key(path, freq_limit)
+    if use_cache and key in _TABLE_CACHE:
+        return _TABLE_CACHE[key]
+
+    cache = _table_cache_dir(key) if use_cache else None
+    if cache is not None:
+        t0 = time.perf_counter()
+        table = _read_table_cache(cache)
+        if table is not None:
+            _LOG.info(
+                "Loaded %d words from cache %s (%.2f s)",
+                len(table.words), cache, time.perf_counter() - t0,
+            )
+            _TABLE_CACHE[key] = table
+            return table
+
+    words = load_dictionary(path, freq_limit)
+    t0 = time.perf_counter()
+    table = build_word_table(words)
+    _LOG.debug("Encoded %d words (%.1f s)", len(table.words), time.perf_counter() - t0)
+    if cache is not None:
+        _write_table_cache(cache, table)
+    _TABLE_CACHE[key] = table
+    return table
+
+
 # ─── DICTIONARY FILTER ───────────────────────────────────────────────────────
-def filter_words(words: Sequence[str], letter_counts: Counter) -> List[str]:
+def filter_words(words: Sequence[str] | WordTable, letter_counts: Counter) -> List[str]:
     """
     Keep only buildable words; apply MIN_WORD_LEN & 2‑letter whitelist.
+
+    *words* may be a prebuilt :class:`WordTable` so repeated calls against
+    the same dictionary skip the encoding step.  The (slow) spell‑check
+    only runs on the words that survive the vectorised screen.
     """
-    can_build = []
-    for w in words:
-        if len(w) < MIN_WORD_LEN:
+    table = words if isinstance(words, WordTable) else build_word_table(words)
+    return [table.words[i] for i in _buildable_rows(table, letter_counts)]
+
+
+def _buildable_rows(table: WordTable, letter_counts: Counter) -> np.ndarray:
+    """Return the rows of *table* that :func:`filter_words` keeps."""
+    pool = pool_vector(letter_counts)
+    pool_mask, _ = letter_masks(pool[None, :])
+
+    # bitset screen first; only words with repeated letters need counts
+    buildable = table.eligible & ((table.mask & ~pool_mask[0]) == 0)
+    recheck = np.flatnonzero(buildable & table.has_dupes)
+    buildable[recheck] = (table.vecs[recheck] <= pool).all(axis=1)
+
+    rows = np.array(
+        [i for i in np.flatnonzero(buildable) if is_valid_word(table.words[i])],
+        dtype=np.int64,
+    )
+
+    _LOG.info(f"Candidate words after filtering: {len(rows):,d}")
+    return rows
+
+# ─── DFS KERNEL ──────────────────────────────────────────────────────────────
+@njit(cache=True)
+def _dfs_kernel(
+    word_vecs, word_lens, word_mask, has_dupes, letter_ptr, letter_idx,
+    rem_len, rem_supply, pool, cursor, chosen, best_chosen,
+    sp, used, remaining, best_used, best_sp, budget,
+):
+    """
+    Resumable iterative branch‑and‑bound over words sorted for the search.
+
+    ``cursor[d]`` is the next word index to try at depth *d* and
+    ``chosen[d]`` the word placed there; *pool* is mutated in place and
+    restored on backtrack, and *pool_mask* mirrors its non‑empty letters
+    so most candidates are rejected by one bitwise test.  A branch is
+    pruned when neither the suffix length ``rem_len`` nor the per‑letter
+    suffix supply ``rem_supply`` (capped by what is left in *pool*) can
+    beat *best_used*.  Runs at most *budget* steps and returns the updated
+    ``(sp, used, remaining, best_used, best_sp)`` so the caller can check
+    the wall clock and resume; ``sp < 0`` means the search finished.
+    Without Numba it runs as plain Python and is handed lists, not arrays.
+    """
+    n = len(word_lens)
+    pool_mask = 0
+    for c in range(len(pool)):
+        if pool[c] > 0:
+            pool_mask |= 1 << c
+
+    while sp >= 0 and budget > 0:
+        budget -= 1
+        i = cursor[sp]
+        if i >= n:                           # level exhausted → backtrack
+            sp -= 1
+            if sp >= 0:
+                j = chosen[sp]
+                for k in range(letter_ptr[j], letter_ptr[j + 1]):
+                    pool[letter_idx[k]] += word_vecs[j][letter_idx[k]]
+                pool_mask |= word_mask[j]
+                used -= word_lens[j]
+                remaining += word_lens[j]
+            continue
+        cursor[sp] = i + 1
+
+        wl = word_lens[i]
+        if wl > remaining:
+            continue
+        if word_mask[i] & ~pool_mask:
             continue
-        if len(w) == 2 and w not in ALLOWED_TWO_LETTERS:
+        if has_dupes[i]:
+            fits = True
+            for k in range(letter_ptr[i], letter_ptr[i + 1]):
+                if word_vecs[i][letter_idx[k]] > pool[letter_idx[k]]:
+                    fits = False
+                    break
+            if not fits:
+                continue
+
+        # push word i
+        for k in range(letter_ptr[i], letter_ptr[i + 1]):
+            pool[letter_idx[k]] -= word_vecs[i][letter_idx[k]]
+            if pool[letter_idx[k]] == 0:
+                pool_mask &= ~(1 << letter_idx[k])
+        used += wl
+        remaining -= wl
+        chosen[sp] = i
+
+        bound = used + rem_len[i + 1]
+        if bound > best_used:
+            supply = used
+            for c in range(len(pool)):
+                supply += min(pool[c], rem_supply[i + 1][c])
+            bound = min(bound, supply)
+        if bound <= best_used:
+            # bound: undo the push straight away
+            for k in range(letter_ptr[i], letter_ptr[i + 1]):
+                pool[letter_idx[k]] += word_vecs[i][letter_idx[k]]
+            pool_mask |= word_mask[i]
+            used -= wl
+            remaining += wl
             continue
+        if used > best_used:
+            best_used = used
+            best_sp = sp + 1
+            best_chosen[:best_sp] = chosen[:best_sp]
+        sp += 1
+        cursor[sp] = i + 1
+
+    return sp, used, remaining, best_used, best_sp
+
+
+class _SearchArrays(NamedTuple):
+    """Read‑only per‑search arrays, in :func:`_dfs_kernel` argument order."""
+
+    word_vecs: np.ndarray
+    word_lens: np.ndarray
+    word_mask: np.ndarray
+    has_dupes: np.ndarray
+    letter_ptr: np.ndarray
+    letter_idx: np.ndarray
+    rem_len: np.ndarray
+    rem_supply: np.ndarray
+
+
+def _search(
+    arrays: _SearchArrays,
+    pool: np.ndarray,
+    prefix: Tuple[int, ...],
+    base_used: int,
+    best_used: int,
+    deadline: float,
+    shared_best=None,
+) -> Tuple[Tuple[int, List[int]] | None, bool]:
+    """
+    Run the DFS kernel over the subtree below *prefix* until it finishes or
+    *deadline* passes.
+
+    Only covers better than *best_used* are reported.  If *shared_best*
+    (a ``multiprocessing.Value``) is given, the bound is refreshed from it
+    between kernel slices and raised whenever this search improves on it.
+
+    Returns
+    -------
+    found
+        ``(used, word_indices)`` of the best cover below *prefix*
+        (including *prefix* itself), or ``None`` if nothing beat *best_used*.
+    done
+        ``True`` if the subtree was searched exhaustively.
+    """
+    n = len(arrays.word_lens)
+    pool = pool.copy()
+    cursor = np.full(n + 1, n, dtype=np.int32)   # prefix levels have no siblings
+    chosen = np.zeros(n + 1, dtype=np.int32)
+    best_chosen = np.zeros(n + 1, dtype=np.int32)
+    used = base_used
+    for d, i in enumerate(prefix):
+        pool -= arrays.word_vecs[i]
+        used += int(arrays.word_lens[i])
+        chosen[d] = i
+    sp, best_sp = len(prefix), 0
+    cursor[sp] = prefix[-1] + 1 if prefix else 0
+    remaining = int(pool.sum())                 # letters still in the pool
+    if not _USE_NUMBA:
+        # interpreted kernel: list indexing is far cheaper than numpy scalars
+        arrays = _SearchArrays(*(a.tolist() for a in arrays))
+        pool, cursor, chosen, best_chosen = (
+            a.tolist() for a in (pool, cursor, chosen, best_chosen)
+        )
+
+    found = None
+    if used > best_used:
+        best_used = used
+        found = (used, list(prefix))
+
+    while sp >= 0 and time.time() <= deadline:
+        if shared_best is not None:
+            best_used = max(best_used, shared_best.value)
+        before = best_used
+        sp, used, remaining, best_used, best_sp = _dfs_kernel(
+            *arrays, pool, cursor, chosen, best_chosen,
+            sp, used, remaining, best_used, best_sp, DFS_SLICE,
+        )
+        if best_used > before:
+            found = (int(best_used), [int(j) for j in best_chosen[:best_sp]])
+            _LOG.debug(f"New best {found[0]} letters: word indices {found[1]}")
+            if shared_best is not None:
+                with shared_best.get_lock():
+                    shared_best.value = max(shared_best.value, found[0])
+
+    return found, sp < 0
+
+
+# ─── PARALLEL SEARCH ─────────────────────────────────────────────────────────
+_WORKER: dict[str, object] = {}                 # per‑process search state
+
+
+def _init_worker(arrays, pool, base_used, shared_best, deadline) -> None:
+    _WORKER.update(
+        arrays=arrays, pool=pool, base_used=base_used,
+        shared_best=shared_best, deadline=deadline,
+    )
 
-        wc = Counter(w)
-        if all(wc[ch] <= letter_counts.get(ch, 0) for ch in wc) and is_valid_word(w):
-            can_build.append(w)
 
-    _LOG.info(f"Candidate words after filtering: {len(can_build):,d}")
-    return can_build
+def _search_task(prefix: Tuple[int, ...]):
+    shared_best = _WORKER["shared_best"]
+    return _search(
+        _WORKER["arrays"], _WORKER["pool"], prefix, _WORKER["base_used"],
+        shared_best.value, _WORKER["deadline"], shared_best,
+    )
+
+
+def _split_prefixes(
+    arrays: _SearchArrays,
+    pool: np.ndarray,
+    base_used: int,
+    target: int,
+) -> Tuple[List[Tuple[int, ...]], Tuple[int, List[int]]]:
+    """
+    Expand the top of the search tree breadth‑first until there are at least
+    *target* subtrees to hand out.  Earlier (longer‑word, usually heavier)
+    nodes are expanded first; the rest of a level is left whole.
+
+    Returns the subtree prefixes, in search order, and the best cover among
+    the interior nodes that were expanded here.
+    """
+    vecs, lens = arrays.word_vecs, arrays.word_lens
+    found = (base_used, [])
+    tasks: List[Tuple[int, ...]] = [()]
+    while tasks and len(tasks) < target:
+        expanded: List[Tuple[int, ...]] = []
+        for k, p in enumerate(tasks):
+            if len(expanded) + len(tasks) - k >= target:
+                expanded.extend(tasks[k:])      # enough work: keep the rest whole
+                break
+            idx = list(p)
+            rest = pool - vecs[idx].sum(axis=0)
+            start = p[-1] + 1 if p else 0
+            kids = start + np.flatnonzero((vecs[start:] <= rest).all(axis=1))
+            used = base_used + int(lens[idx].sum())
+            if used > found[0]:
+                found = (used, idx)
+            expanded.extend(p + (int(j),) for j in kids)
+        tasks = expanded
+    return tasks, found
+
+
+def _parallel_search(
+    arrays: _SearchArrays,
+    pool: np.ndarray,
+    base_used: int,
+    best_used: int,
+    deadline: float,
+    workers: int,
+) -> Tuple[Tuple[int, List[int]] | None, bool]:
+    """
+    Search the whole tree with a pool of *workers* processes.
+
+    Subtrees from :func:`_split_prefixes` form a work pile that idle
+    workers pull from in order; all workers prune against one shared best
+    score.  Same return convention as :func:`_search`.
+    """
+    prefixes, found = _split_prefixes(arrays, pool, base_used, workers * 8)
+    if found[0] <= best_used:
+        found = None
+    else:
+        best_used = found[0]
+
+    ctx = multiprocessing.get_context()
+    shared_best = ctx.Value("q", best_used)
+    done = True
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(arrays, pool, base_used, shared_best, deadline),
+    ) as executor:
+        for res, finished in executor.map(_search_task, prefixes):
+            done &= finished
+            if res is not None and (found is None or res[0] > found[0]):
+                found = res
+    return found, done
 
-# ─── GREEDY SEED & TIMEOUT IN DFS ────────────────────────────────────────────
-import time
 
 # ─── GREEDY SEED & TIMEOUT IN DFS ────────────────────────────────────────────
 def find_best_cover(
     words: Sequence[str],
     letter_counts: Counter,
     timeout: float = TIMEOUT_SEC,
+    workers: int | None = None,
+    encoded: Tuple[np.ndarray, np.ndarray] | None = None,
 ) -> Tuple[List[str], int]:
     """
     Branch‑and‑bound DFS with:
+      • words ordered by length, then by how scarce their letters are;
       • greedy initial solution (longest single buildable word);
-      • wall‑clock timeout.
+      • wall‑clock timeout;
+      • searches still running after PARALLEL_AFTER_SEC are restarted
+        across *workers* processes (default: one per CPU; ``1`` disables).
+
+    *encoded* may pass ``encode_words(words)`` when the caller already has
+    it (e.g. rows of a :class:`WordTable`), so words are not re‑encoded.
 
     Returns
     -------
@@ -171,53 +685,70 @@ def find_best_cover(
         Total letters used by *best_subset*.
     """
     deadline = time.time() + timeout
-    words = sorted(words, key=len, reverse=True)
+    workers = workers or os.cpu_count() or 1
     n = len(words)
+    word_vecs, word_lens = encoded if encoded is not None else encode_words(words)
+    pool = pool_vector(letter_counts)
+
+    # longest first; ties go to words that spend the pool's scarce letters,
+    # which are the hardest to place later in the search
+    scarcity = 1.0 / (pool + 1.0)
+    score = word_lens * 100.0 + word_vecs @ scarcity
+    order = np.argsort(-score, kind="stable")
+    words = [words[i] for i in order]
+    word_vecs, word_lens = word_vecs[order], word_lens[order]
 
     # ── Greedy seed ──────────────────────────────────────────────────────────
     best: dict[str, object] = {"used": 0, "subset": []}  # record of best so far
     chosen0: List[str] = []                              # initial path for DFS
-    for w in words:
-        wc = Counter(w)
-        if all(c <= letter_counts[ch] for ch, c in wc.items()):
-            best["subset"] = [w]
-            best["used"] = len(w)
-            chosen0 = [w]                    # put the word on the search stack
-            for ch, c in wc.items():         # remove its letters from the pool
-                letter_counts[ch] -= c
-            break
+    fits = np.flatnonzero((word_vecs <= pool).all(axis=1))
+    if fits.size:
+        # the seed stays on the search stack, so pick it as a plain length
+        # sort would: longest first, ties in input order
+        longest = fits[word_lens[fits] == word_lens[fits[0]]]
+        i = int(longest[np.argmin(order[longest])])
+        best["subset"] = [words[i]]
+        best["used"] = int(word_lens[i])
+        chosen0 = [words[i]]                 # put the word on the search stack
+        pool -= word_vecs[i]                 # remove its letters from the pool
 
     # suffix length sum for branch‑and‑bound
-    rem_len = [0] * (n + 1)
-    for i in range(n - 1, -1, -1):
-        rem_len[i] = rem_len[i + 1] + len(words[i])
+    rem_len = np.zeros(n + 1, dtype=np.int64)
+    rem_len[:n] = np.cumsum(word_lens[::-1])[::-1]
+
+    # suffix per‑letter supply: how many of each letter words[i:] could use
+    rem_supply = np.zeros((n + 1, ALPHABET_SIZE), dtype=np.int32)
+    rem_supply[:n] = np.cumsum(word_vecs[::-1], axis=0, dtype=np.int32)[::-1]
+
+    word_mask, has_dupes = letter_masks(word_vecs)
+    letter_ptr, letter_idx = _letter_index(word_vecs, pool)
+    arrays = _SearchArrays(
+        word_vecs, word_lens, word_mask, has_dupes,
+        letter_ptr, letter_idx, rem_len, rem_supply,
+    )
+    base_used = int(best["used"])
 
-    # ── Depth‑first search ───────────────────────────────────────────────────
-    def dfs(idx: int, counts: Counter, chosen: List[str], used: int) -> None:
-        if time.time() > deadline:
-            return
-        if used + rem_len[idx] <= best["used"]:
-            return
-        if used > best["used"]:
-            best["used"] = used
-            best["subset"] = chosen.copy()
+    def record(found: Tuple[int, List[int]] | None) -> None:
+        if found is not None and found[0] > best["used"]:
+            best["used"] = found[0]
+            best["subset"] = chosen0 + [words[j] for j in found[1]]
             _LOG.debug(f"New best {best['used']} letters: {best['subset']}")
 
-        for i in range(idx, n):
-            w = words[i]
-            if len(w) > sum(counts.values()):
-                continue
-            wc = Counter(w)
-            if all(wc[ch] <= counts.get(ch, 0) for ch in wc):
-                new_counts = counts.copy()
-                for ch, cnt in wc.items():
-                    new_counts[ch] -= cnt
-                chosen.append(w)
-                dfs(i + 1, new_counts, chosen, used + len(w))
-                chosen.pop()
-
+    # ── Depth‑first search ───────────────────────────────────────────────────
     _LOG.info(f"Starting DFS over {n:,d} words … timeout {timeout}s")
-    dfs(0, letter_counts.copy(), chosen0, best["used"])
+    split_at = min(deadline, time.time() + PARALLEL_AFTER_SEC) if workers > 1 else deadline
+    found, done = _search(arrays, pool, (), base_used, best["used"], split_at)
+    record(found)
+
+    if not done and workers > 1 and time.time() < deadline:
+        _LOG.info(f"Search still running; splitting it across {workers} processes")
+        found, done = _parallel_search(
+            arrays, pool, base_used, best["used"], deadline, workers
+        )
+        record(found)
+
+    if not done:
+        _LOG.info("DFS timed out; returning best cover found so far")
     return best["subset"], best["used"]
 
 
@@ -225,6 +756,8 @@ def solve(
     letters: str,
     dictionary_path: str | None = None,
     freq_limit: int = 200_000,
+    use_cache: bool = True,
+    workers: int | None = None,
 ) -> Tuple[List[str], int]:
     """
     Solve for the *letters* string.
@@ -237,6 +770,10 @@ def solve(
         Optional local word‑file override.
     freq_limit
         If *wordfreq* is the dictionary source, how many top words to load.
+    use_cache
+        Reuse the encoded dictionary cached under :data:`CACHE_DIR`.
+    workers
+        Processes for long searches (see :func:`find_best_cover`).
 
     Returns
     -------
@@ -250,14 +787,18 @@ def solve(
     _LOG.info("Letter pool: %s (%d letters)", letters, len(letters))
 
     # Choose appropriate dictionary loader
-    words = (
-        load_dictionary(dictionary_path or "/usr/share/dict/words", freq_limit)
+    table = (
+        load_word_table(dictionary_path or "/usr/share/dict/words", freq_limit, use_cache)
         if dictionary_path or (not _USE_ENGLISH_WORDS and not _USE_WORDFREQ)
-        else load_dictionary(freq_limit=freq_limit)
+        else load_word_table(freq_limit=freq_limit, use_cache=use_cache)
     )
 
-    candidates = filter_words(words, letter_counts)
-    best_subset, used = find_best_cover(candidates, letter_counts)
+    rows = _buildable_rows(table, letter_counts)
+    candidates = [table.words[i] for i in rows]
+    best_subset, used = find_best_cover(
+        candidates, letter_counts, workers=workers,
+        encoded=(table.vecs[rows], table.lens[rows]),
+    )
     unused = len(letters) - used
     return best_subset, unused
 
@@ -299,6 +840,19 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         metavar="SEC",
         help=f"Abort search after SEC seconds (default {TIMEOUT_SEC}).",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help=f"Rebuild the encoded dictionary instead of using {CACHE_DIR}.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Processes for searches longer than "
+             f"{PARALLEL_AFTER_SEC:g}s (default: one per CPU; 1 disables).",
+    )
     return parser.parse_args(argv)
 
 
@@ -307,7 +861,13 @@ def main(argv: Sequence[str] | None = None) -> None:
     args = _parse_args(argv)
     _configure_logging(args.verbose)
 
-    best_set, unused = solve(args.letters, args.dict_path, args.freq_limit)
+    best_set, unused = solve(
+        args.letters,
+        args.dict_path,
+        args.freq_limit,
+        use_cache=args.use_cache,
+        workers=args.workers,
+    )
 
     print("Best word set:", best_set)
     print(f"Letters unused: {unused}")
@@ -16,15 +16,18 @@ from __future__ import annotations
 
 import argparse
 import itertools
-import json
 import random
 import sys
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+import orjson
+
 try:
-    from wordfreq import iter_wordlist, zipf_frequency  # type: ignore
+    from wordfreq import get_frequency_dict, iter_wordlist, zipf_frequency  # type: ignore
 except ImportError:
     sys.exit("ERROR: `wordfreq` missing.  Install with `pip install wordfreq`")
 
@@ -42,12 +45,21 @@ DEFAULT_LEN_PROBS: Dict[int, float] = {
 }
 
 RNG = random.Random()
+NP_RNG = np.random.default_rng()   # letter shuffles; reseeded by build_dataset(seed=...)
+
+
+@lru_cache(maxsize=None)
+def _zipf(word: str) -> float:
+    """Memoised ``zipf_frequency(word, "en")``; cleared by :func:`build_dataset`."""
+    return zipf_frequency(word, "en")
+
 
 def shuffle_letters(words: Sequence[str]) -> str:
     """Return a random permutation of all letters in *words*."""
-    letters = [c for w in words for c in w]
-    RNG.shuffle(letters)
-    return "".join(letters)
+    # shuffle UTF‑32 code units in C rather than a Python list of characters
+    buf = np.frombuffer("".join(words).encode("utf-32-le"), dtype=np.uint32).copy()
+    NP_RNG.shuffle(buf)
+    return buf.tobytes().decode("utf-32-le")
 
 
 def load_word_buckets(max_dict_words: int | None = None) -> Dict[str, List[str]]:
@@ -59,15 +71,18 @@ def load_word_buckets(max_dict_words: int | None = None) -> Dict[str, List[str]]
     words_iter = iter_wordlist("en", wordlist="best")
     if max_dict_words is not None:
         words_iter = itertools.islice(words_iter, max_dict_words)
-
-    for w in words_iter:
-        if not w.isalpha():
-            continue
-        z = zipf_frequency(w, "en")
-        for (low, high), name in zip(BUCKETS, BUCKET_NAMES):
-            if low <= z < high:
-                buckets[name].append(w.upper())
-                break
+    words = [w for w in words_iter if w.isalpha()]
+
+    # Zipf = log10(frequency per billion words), rounded like zipf_frequency;
+    # read straight from wordfreq's table instead of one API call per word
+    freqs = get_frequency_dict("en", wordlist="best")
+    zipfs = np.round(np.log10([freqs[w] for w in words]) + 9.0, 2)
+
+    unbucketed = np.ones(len(words), dtype=bool)
+    for (low, high), name in zip(BUCKETS, BUCKET_NAMES):
+        in_bucket = unbucketed & (low <= zipfs) & (zipfs < high)
+        unbucketed &= ~in_bucket
+        buckets[name].extend(words[i].upper() for i in np.flatnonzero(in_bucket))
     return buckets
 
 
@@ -114,7 +129,7 @@ def make_example(
             fallback=word_buckets["common"],
         )
         words.append(w)
-        zipfs.append(zipf_frequency(w.lower(), "en"))
+        zipfs.append(_zipf(w.lower()))
 
     return {
         "puzzle": shuffle_letters(words),
@@ -133,15 +148,19 @@ def build_dataset(
     seed: int | None = None,
 ) -> None:
     """Generate *examples* puzzles and save to *outfile* (JSONL)."""
+    global NP_RNG
     if seed is not None:
         RNG.seed(seed)
+        NP_RNG = np.random.default_rng(seed)
 
     buckets = load_word_buckets(dict_words)
 
-    with outfile.open("w", encoding="utf-8") as fh:
-        for _ in range(examples):
-            n = RNG.randint(min_words, max_words)
-            fh.write(json.dumps(make_example(buckets, n, length_probs)) + "\n")
+    lines: List[bytes] = []
+    for _ in range(examples):
+        n = RNG.randint(min_words, max_words)
+        lines.append(orjson.dumps(make_example(buckets, n, length_probs)) + b"\n")
+    outfile.write_bytes(b"".join(lines))
+    _zipf.cache_clear()
 
 
 # CLI                                                                    
@@ -6,9 +6,11 @@ open_r1's SFT script.
 """
 
 from pathlib import Path
-import json, random
+import hashlib, json, random
+import orjson
 from datasets import Dataset, DatasetDict
 from build_dataset import build_dataset      
+import morph_cot
 from morph_cot  import build_morph_cot    
 
 RAW_PATH = Path("raw_puzzles.jsonl")
@@ -27,7 +29,7 @@ SYSTEM_TXT = (
 )
 
 def make_example(line: str):
-    rec  = json.loads(line)
+    rec  = orjson.loads(line)
     rack = rec["puzzle"].upper()
     words = rec["solution"]     
     user_prompt = (
@@ -41,6 +43,7 @@ def make_example(line: str):
         solution=words,
         unused=len(set(rack)) - len("".join(words)), 
         zipf_scores=rec.get("zipf_scores"),
+        trusted=True,
     )
 
     assistant_msg = f"<think>\n{cot}\n</think>\n<answer>{json.dumps(words)}</answer>"
@@ -53,16 +56,30 @@ def make_example(line: str):
         ]
     }
 
-examples = [make_example(l) for l in RAW_PATH.read_text().splitlines()]
+# Dataset.from_generator caches its output under a fingerprint of the
+# generator and gen_kwargs, and hashes the imported build_morph_cot by name
+# only: put the template source in gen_kwargs so editing it regenerates
+COT_VERSION = hashlib.sha1(Path(morph_cot.__file__).read_bytes()).hexdigest()
+
+def iter_examples(lines, cot_version):
+    for line in lines:
+        yield make_example(line)
+
+# shuffle the raw records; examples are built lazily and streamed into Arrow
+raw_lines = RAW_PATH.read_text().splitlines()
 
 random.seed(27)
-random.shuffle(examples)
+random.shuffle(raw_lines)
 
 # 5 % validation
-split = int(len(examples) * 0.05)    
+split = int(len(raw_lines) * 0.05)    
 ds = DatasetDict({
-    "train": Dataset.from_list(examples[split:]),
-    "validation": Dataset.from_list(examples[:split]),
+    "train": Dataset.from_generator(
+        iter_examples, gen_kwargs={"lines": raw_lines[split:], "cot_version": COT_VERSION}
+    ),
+    "validation": Dataset.from_generator(
+        iter_examples, gen_kwargs={"lines": raw_lines[:split], "cot_version": COT_VERSION}
+    ),
 })
 
 LOCAL_DIR = Path("word_puzzle_cot")
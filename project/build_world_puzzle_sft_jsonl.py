@@ -9,8 +9,10 @@ import json
 import random
 from pathlib import Path
 
+import orjson
+
 from build_dataset import build_dataset    
-from morph_cot import build_morph_cot      
+from morph_cot import build_morph_cot_batch
 
 RAW_JSONL = Path("raw_puzzles.jsonl")
 TRAIN_JSONL = Path("train.jsonl")
@@ -42,11 +44,17 @@ build_dataset(
     seed=SEED_RAW,
 )
 
-def make_example(record: dict) -> dict:
+def cot_row(record: dict) -> tuple:
+    """``(puzzle, solution, unused, zipf_scores)`` for build_morph_cot."""
     rack   = record["puzzle"].upper()
     words  = record["solution"]
     # crude leftover count
     unused = len(rack) - sum(len(w) for w in words)
+    return rack, words, unused, record.get("zipf_scores")
+
+def make_example(record: dict, cot: str) -> dict:
+    rack   = record["puzzle"].upper()
+    words  = record["solution"]
 
     user_prompt = (
         f"Available letters (each can be used once): {' '.join(rack)}\n\n"
@@ -54,13 +62,6 @@ def make_example(record: dict) -> dict:
         'Return your answer as a JSON array of uppercase words, e.g.: ["CAT", "BAT"].'
     )
 
-    cot = build_morph_cot(
-        puzzle=rack,
-        solution=words,
-        unused=unused,
-        zipf_scores=record.get("zipf_scores"),
-    )
-
     assistant_msg = (
         "<think>\n" + cot + "\n</think>\n"
         "<answer>" + json.dumps(words) + "</answer>"
@@ -74,26 +75,31 @@ def make_example(record: dict) -> dict:
         ]
     }
 
-print("[2/4] Transforming raw puzzles → ChatML examples")
+def iter_jsonl(lines):
+    """Yield serialised ChatML examples for raw puzzle *lines*, one at a time."""
+    records = [orjson.loads(line) for line in lines]
+    # the CoTs are built across processes; the examples around them one by one
+    cots = build_morph_cot_batch([cot_row(r) for r in records], trusted=True)
+    for record, cot in zip(records, cots):
+        yield orjson.dumps(make_example(record, cot)) + b"\n"
+
+# Shuffle the (small) raw records rather than the (large) CoT examples, so
+# only the CoT strings, not whole examples, are held in memory while writing.
+print("[2/4] Shuffling and splitting raw puzzles into train/validation")
 raw_lines = RAW_JSONL.read_text().splitlines()
-examples = [ make_example(json.loads(line)) for line in raw_lines ]
-
-print("[3/4] Shuffling and splitting into train/validation")
 random.seed(SEED_SPLIT)
-random.shuffle(examples)
-n_val = int(len(examples) * VAL_FRACTION)
+random.shuffle(raw_lines)
+n_val = int(len(raw_lines) * VAL_FRACTION)
 
-val_set   = examples[:n_val]
-train_set = examples[n_val:]
+val_set   = raw_lines[:n_val]
+train_set = raw_lines[n_val:]
 
-print(f"[4/4] Writing {len(train_set)} train → {TRAIN_JSONL}")
-with TRAIN_JSONL.open("w", encoding="utf-8") as fh:
-    for ex in train_set:
-        fh.write(json.dumps(ex) + "\n")
+print(f"[3/4] Transforming + writing {len(train_set)} train → {TRAIN_JSONL}")
+with TRAIN_JSONL.open("wb") as fh:
+    fh.writelines(iter_jsonl(train_set))
 
-print(f"[4/4] Writing {len(val_set)} validation → {VAL_JSONL}")
-with VAL_JSONL.open("w", encoding="utf-8") as fh:
-    for ex in val_set:
-        fh.write(json.dumps(ex) + "\n")
+print(f"[4/4] Transforming + writing {len(val_set)} validation → {VAL_JSONL}")
+with VAL_JSONL.open("wb") as fh:
+    fh.writelines(iter_jsonl(val_set))
 
 print("All done! 🎉")
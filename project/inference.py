@@ -1,35 +1,82 @@
-from transformers import AutoTokenizer, AutoModelForCausalLM
+import importlib.util
+
+import torch
+from transformers import (
+    AutoTokenizer,
+    AutoModelForCausalLM,
+    StoppingCriteria,
+    StoppingCriteriaList,
+)
 
 checkpoint = "./trainer_output/checkpoint-1000"
-tokenizer = AutoTokenizer.from_pretrained(checkpoint)
-model     = AutoModelForCausalLM.from_pretrained(checkpoint).cuda()
+tokenizer = AutoTokenizer.from_pretrained(checkpoint, padding_side="left")
+if tokenizer.pad_token is None:
+    tokenizer.pad_token = tokenizer.eos_token
+# bf16 weights + fused attention; fall back to PyTorch SDPA without flash-attn
+attn = "flash_attention_2" if importlib.util.find_spec("flash_attn") else "sdpa"
+model     = AutoModelForCausalLM.from_pretrained(
+    checkpoint,
+    torch_dtype=torch.bfloat16,
+    attn_implementation=attn,
+    device_map="cuda",
+)
 system_prompt = "You are a word-formation agent for a Bananagrams-style game. A conversation between User and Assistant. The user asks a question, and the Assistant solves it. The assistant first thinks about the reasoning process in the mind and then provides the user with the answer. The reasoning process and answer are enclosed within <think> </thinkz> and <answer> </answer> tags."
-user_prompt   = "Available letters (each can be used once): L P P A R D I O V E N T C N A L E T E Y D I O E I A C N T L A E N I A K I N E N L D E G D N G P I I O N Y T C R U I L M Y I G T A H R C E S H F S K H I E I K I R D S U T N H E R E R A R G A A Y A A D M E R N B U N I U M L I H T N \n\nForm as many valid English words as you can using these letters. Return your answer as a JSON array of uppercase words, e.g.: [\"CAT\", \"BAT\"]."
+user_prompts  = ["Available letters (each can be used once): L P P A R D I O V E N T C N A L E T E Y D I O E I A C N T L A E N I A K I N E N L D E G D N G P I I O N Y T C R U I L M Y I G T A H R C E S H F S K H I E I K I R D S U T N H E R E R A R G A A Y A A D M E R N B U N I U M L I H T N \n\nForm as many valid English words as you can using these letters. Return your answer as a JSON array of uppercase words, e.g.: [\"CAT\", \"BAT\"]."]
 
-chatml = (
+chatml = [
     "<|im_start|>system\n"
     f"{system_prompt}\n"
     "<|im_end|><|im_start|>user\n"
     f"{user_prompt}\n"
     "<|im_end|><|im_start|>assistant"
-)
+    for user_prompt in user_prompts
+]
 
-inputs = tokenizer(chatml, return_tensors="pt").to("cuda")
+# prompts are left-padded into one batch; attention_mask hides the padding
+inputs = tokenizer(chatml, padding=True, return_tensors="pt").to("cuda")
 in_len = inputs["input_ids"].shape[1]
 print("prompt tokens:", in_len, 
       "max:", model.config.max_position_embeddings)
 
-# 3) Generate with explicit EOS/PAD
-out_ids = model.generate(
-    **inputs,
-    max_new_tokens=20000,
-    eos_token_id=tokenizer.eos_token_id,
-    pad_token_id=tokenizer.eos_token_id,
-    do_sample=True,
-    temperature=1.0,
-    top_p=0.9,
+
+class StopOnText(StoppingCriteria):
+    """Finish each sequence once its recent tokens decode to contain *text*."""
+
+    def __init__(self, tokenizer, text, in_len, tail_tokens=16):
+        self.tokenizer = tokenizer
+        self.text = text
+        self.in_len = in_len
+        self.tail_tokens = tail_tokens
+
+    def __call__(self, input_ids, scores, **kwargs):
+        tails = self.tokenizer.batch_decode(
+            input_ids[:, max(self.in_len, input_ids.shape[1] - self.tail_tokens):]
+        )
+        return torch.tensor(
+            [self.text in tail for tail in tails], device=input_ids.device
+        )
+
+
+# the model rambles past its answer; stop there, within the context window
+max_new_tokens = min(2048, model.config.max_position_embeddings - in_len)
+stopping_criteria = StoppingCriteriaList(
+    [StopOnText(tokenizer, "</answer>", in_len)]
 )
 
+# 3) Generate with explicit EOS/PAD
+with torch.inference_mode():
+    out_ids = model.generate(
+        **inputs,
+        max_new_tokens=max_new_tokens,
+        stopping_criteria=stopping_criteria,
+        eos_token_id=tokenizer.eos_token_id,
+        pad_token_id=tokenizer.pad_token_id,
+        use_cache=True,
+        do_sample=True,
+        temperature=1.0,
+        top_p=0.9,
+    )
+
 # 4) Decode only the newly generated portion
-generated = out_ids[0, in_len:].tolist()
-print(tokenizer.decode(generated, skip_special_tokens=True))
\ No newline at end of file
+for generated in out_ids[:, in_len:].tolist():
+    print(tokenizer.decode(generated, skip_special_tokens=True))
\ No newline at end of file
@@ -5,10 +5,14 @@ Letter distribution strategies for the Bananagrams-style word game.
 """
 import random
 
+import numpy as np
+
 class BaseLetterDistribution:
     """Base class for letter distributions."""
     def __init__(self, rng=None):
         self.rng = rng or random.Random()
+        # vectorised draws; seeded from rng so a seeded rng stays reproducible
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
 
     def sample(self, n):
         """Return a list of n letters sampled according to distribution."""
@@ -19,9 +23,10 @@ class UniformDistribution(BaseLetterDistribution):
     def __init__(self, rng=None):
         super().__init__(rng)
         self.letters = [chr(ord('A') + i) for i in range(26)]
+        self._letters_arr = np.array(self.letters, dtype='<U1')
 
     def sample(self, n):
-        return [self.rng.choice(self.letters) for _ in range(n)]
+        return self._letters_arr[self.np_rng.integers(0, 26, size=n)].tolist()
 
 class FrequencyDistribution(BaseLetterDistribution):
     """Sample letters according to English letter frequencies."""
@@ -38,9 +43,11 @@ class FrequencyDistribution(BaseLetterDistribution):
         self.freq = freq or self.DEFAULT_FREQ
         total = sum(self.freq.values())
         self.letters, self.weights = zip(*[(l, w / total) for l, w in self.freq.items()])
+        self._letters_arr = np.array(self.letters, dtype='<U1')
+        self._p = np.asarray(self.weights, dtype=np.float64)
 
     def sample(self, n):
-        return self.rng.choices(self.letters, weights=self.weights, k=n)
+        return self.np_rng.choice(self._letters_arr, size=n, p=self._p).tolist()
 
 class ScrabbleDistribution(BaseLetterDistribution):
     """Sample letters according to Scrabble tile distribution."""
@@ -55,14 +62,15 @@ class ScrabbleDistribution(BaseLetterDistribution):
 
     def __init__(self, rng=None):
         super().__init__(rng)
-        self.bag = []
-        for letter, count in self.TILES.items():
-            self.bag.extend([letter] * count)
+        self.bag_arr = np.array(
+            [letter for letter, count in self.TILES.items() for _ in range(count)],
+            dtype='<U1',
+        )
 
     def sample(self, n):
-        if n > len(self.bag):
-            raise ValueError(f"Cannot sample {n} letters: bag has only {len(self.bag)} tiles.")
-        return self.rng.sample(self.bag, k=n)
+        if n > len(self.bag_arr):
+            raise ValueError(f"Cannot sample {n} letters: bag has only {len(self.bag_arr)} tiles.")
+        return self.np_rng.choice(self.bag_arr, size=n, replace=False).tolist()
 
 class CustomDistribution(BaseLetterDistribution):
     """Sample letters from a user-provided frequency dict."""
@@ -70,6 +78,8 @@ class CustomDistribution(BaseLetterDistribution):
         super().__init__(rng)
         total = sum(freq_dict.values())
         self.letters, self.weights = zip(*[(l, w / total) for l, w in freq_dict.items()])
+        self._letters_arr = np.array(self.letters, dtype='<U1')
+        self._p = np.asarray(self.weights, dtype=np.float64)
 
     def sample(self, n):
-        return self.rng.choices(self.letters, weights=self.weights, k=n)
\ No newline at end of file
+        return self.np_rng.choice(self._letters_arr, size=n, p=self._p).tolist()
\ No newline at end of file
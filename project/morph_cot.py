@@ -6,8 +6,14 @@ This version builds each word only after listing all morphological clues,
 adds fallback reasoning, and handles small words specially.
 """
 
+import os
+import re
 from collections import Counter
-from typing import List, Sequence, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from string import ascii_uppercase
+from typing import Dict, Iterable, Iterator, List, Sequence, Optional, Tuple
+
 try:
     from wordfreq import zipf_frequency  # type: ignore
 except ImportError:
@@ -25,37 +31,202 @@ COMMON_SUFFIXES = (
 )
 
 RARE_LETTERS = set("JQXZK")
+RARE_MASK = sum(1 << (ord(ch) - 65) for ch in RARE_LETTERS)   # bit ord(ch) - 65
+VOWELS = frozenset("AEIOU")
+VOWEL_PAIRS = frozenset(a + b for a in VOWELS for b in VOWELS)
+
+## Racks are 26-entry bytearrays of letter counts, indexed by ord(ch) - 65;
+## anything outside A-Z (accented letters from wordfreq) goes in a side Counter
+LETTERS = ascii_uppercase
+STRUCK = tuple(f"~~{ch}~~" for ch in LETTERS)
+
+class Rack(bytearray):
+    """A-Z counts in 26 slots plus ``extra``, the counts of any other letter."""
+
+    def __init__(self) -> None:
+        super().__init__(26)
+        self.extra: Counter = Counter()
+
 ## Add common consonant clusters (digraphs)
 CLUSTERS = ("TH", "SH", "CH", "PH", "WH", "CK", "QU", "WR")
+CLUSTER_ORDER = {c: i for i, c in enumerate(CLUSTERS)}
+## Every vowel pair or cluster in a word, overlapping ones included ("EAU")
+_VOWEL_CLASS = "[" + "".join(sorted(VOWELS)) + "]"
+PAIR_RE = re.compile(f"(?=({_VOWEL_CLASS}{{2}}|{'|'.join(CLUSTERS)}))")
+## Clue letters as the CoT spells them out, e.g. "I, N, G"
+SPELLED = {c: ", ".join(c) for c in (*COMMON_PREFIXES, *COMMON_SUFFIXES, *VOWEL_PAIRS)}
+## Fixed labels of the lines every step emits
+_HDR_RACK = "### Rack: "
+_STEP_HDR = "**Step "
+_LBL_ALPHA = "- Alphabetize rack: "
+_LBL_FORM = "- So I form the word "
+_LBL_BEFORE = "- Rack before using letters: "
+_LBL_LEFT = "- Letters left: "
+_LBL_NEXT = "- What should I do next?"
+_LBL_LEFTOVER = "**Left-over letters:** "
+_NONE = "-- none --"
+
+## match_prefixes / match_suffixes are generated at import: a trie of the
+## affixes is unrolled into nested `if c == ...` tests on the word's first
+## (last) letters, and each leaf returns its matches as a literal list
+def _matcher_source(name: str, affixes: Sequence[str], reverse: bool = False) -> str:
+    """Source of ``name(word)``: the *affixes* that *word* starts (ends) with."""
+    trie: dict = {}
+    for order, affix in enumerate(affixes):
+        node = trie
+        for ch in (affix[::-1] if reverse else affix):
+            node = node.setdefault(ch, {})
+        node[""] = order                   # "" marks a complete affix
+
+    src = [f"def {name}(word):", "    n = len(word)"]
+
+    def emit(node: dict, depth: int, matched: List[int], indent: int) -> None:
+        pad = " " * indent
+        if "" in node:
+            matched = sorted(matched + [node[""]])   # keep declaration order
+        kids = sorted(k for k in node if k)
+        if kids:
+            src.append(f"{pad}if n > {depth}:")
+            src.append(f"{pad}    c = word[{-depth - 1 if reverse else depth}]")
+            for i, ch in enumerate(kids):
+                src.append(f"{pad}    {'elif' if i else 'if'} c == {ch!r}:")
+                emit(node[ch], depth + 1, matched, indent + 8)
+        src.append(f"{pad}return {[affixes[i] for i in matched]!r}")
+
+    emit(trie, 0, [], 4)
+    return "\n".join(src)
+
+exec(_matcher_source("match_prefixes", COMMON_PREFIXES))
+exec(_matcher_source("match_suffixes", COMMON_SUFFIXES, reverse=True))
+match_prefixes.__doc__ = "COMMON_PREFIXES that *word* starts with, in declaration order."
+match_suffixes.__doc__ = "COMMON_SUFFIXES that *word* ends with, in declaration order."
+
+def _bits(mask: int, items: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(x for i, x in enumerate(items) if mask >> i & 1)
+
+@lru_cache(maxsize=65536)
+def analyze_word(w: str) -> Tuple[Tuple[str, ...], Tuple[str, ...],
+                                  Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return ``(suffixes, prefixes, vowel_pairs, clusters)`` that *w* carries.
+
+    Affixes and clusters come in declaration order, vowel pairs in word
+    order.  Independent of the rack, so repeated words are computed once.
+    """
+    vowel_pairs: List[str] = []
+    cluster_mask = 0
+    for pair in PAIR_RE.findall(w):
+        if pair in VOWEL_PAIRS:
+            vowel_pairs.append(pair)
+        else:
+            cluster_mask |= 1 << CLUSTER_ORDER[pair]
+    return (
+        tuple(match_suffixes(w)),
+        tuple(match_prefixes(w)),
+        tuple(vowel_pairs),
+        _bits(cluster_mask, CLUSTERS),
+    )
+
+def scan_clues(w: str, pool: bytearray, trusted: bool = False
+               ) -> Tuple[Optional[str], Optional[str], List[str], List[str]]:
+    """
+    Return ``(suffix, prefix, vowel_pairs, clusters)`` for word *w*.
+
+    Only clues whose letters are all still in *pool* count; suffix and
+    prefix are the first such entry in COMMON_SUFFIXES / COMMON_PREFIXES.
+    *trusted* skips that check: *w* is known to be buildable from *pool*.
+    """
+    suffixes, prefixes, vowel_pairs, clusters = analyze_word(w)
+    if trusted:
+        return (
+            suffixes[0] if suffixes else None,
+            prefixes[0] if prefixes else None,
+            list(vowel_pairs),
+            list(clusters),
+        )
+
+    def usable(clue: str) -> bool:
+        return all(pool[ord(c) - 65] for c in clue)
+
+    return (
+        next(filter(usable, suffixes), None),
+        next(filter(usable, prefixes), None),
+        list(filter(usable, vowel_pairs)),
+        list(filter(usable, clusters)),
+    )
+
+def letter_counts(letters: Iterable[str]) -> Rack:
+    """Return the counts of *letters*: A-Z in the slots, the rest in ``extra``."""
+    counts = Rack()
+    for ch in letters:
+        i = ord(ch) - 65
+        if 0 <= i < 26:
+            counts[i] += 1
+        else:
+            counts.extra[ch] += 1
+    return counts
+
+def rack_letters(pool: bytearray) -> str:
+    """Return the letters of *pool* alphabetized and space-separated."""
+    letters = " ".join(" ".join(ch * n) for ch, n in zip(LETTERS, pool) if n)
+    extra = getattr(pool, "extra", None)
+    if extra:   # other letters sort after Z, as upper-cased accented ones do
+        rest = [ch for ch in sorted(extra) for _ in range(extra[ch])]
+        return " ".join(filter(None, [letters, *rest]))
+    return letters
 
-def pool_to_markdown(pool: Counter[str], highlight: Sequence[str] | None = None) -> str:
+def pool_to_markdown(pool: bytearray, highlight: Sequence[str] | None = None) -> str:
     """Return Markdown with highlight letters struck through."""
-    counts = pool.copy()
-    strikes = Counter(highlight or [])
-    pieces: List[str] = []
-    for ch in sorted(counts):
-        for _ in range(counts[ch]):
-            if strikes[ch]:
-                pieces.append(f"~~{ch}~~")
-                strikes[ch] -= 1
-            else:
-                pieces.append(ch)
-    return " ".join(pieces) or "-- none --"
+    if not highlight:
+        return rack_letters(pool) or _NONE
+    return render_before_after(pool, letter_counts(highlight))[0]
+
+def render_before_after(counts_before: bytearray, strikes: bytearray) -> Tuple[str, str]:
+    """
+    Return ``(before_md, after)`` for playing *strikes* from *counts_before*.
+
+    *before_md* is ``pool_to_markdown`` of the rack with the played letters
+    struck through; *after* is ``rack_letters`` of what is left ("" when
+    empty).  One pass over the 26 slots, then any other letters, builds
+    both.
+    """
+    before: List[str] = []
+    after: List[str] = []
+    for i in range(26):
+        n = counts_before[i]
+        if n:
+            k = min(strikes[i], n)   # struck copies come first
+            rest = [LETTERS[i]] * (n - k)
+            before += [STRUCK[i]] * k + rest
+            after += rest
+    extra = getattr(counts_before, "extra", None)
+    if extra:   # other letters sort after Z, as upper-cased accented ones do
+        struck = getattr(strikes, "extra", {})
+        for ch in sorted(extra):
+            n = extra[ch]
+            k = min(struck.get(ch, 0), n)
+            rest = [ch] * (n - k)
+            before += [f"~~{ch}~~"] * k + rest
+            after += rest
+    return " ".join(before) or _NONE, " ".join(after)
 
 def explain_choice(word: str) -> str:
     """Fallback morphology-based explanation."""
     parts: List[str] = []
-    for pre in COMMON_PREFIXES:
-        if word.startswith(pre):
-            parts.append(f"begins with the prefix {pre}-")
-            break
-    for suf in COMMON_SUFFIXES:
-        if word.endswith(suf):
-            parts.append(f"ends with the suffix -{suf}")
-            break
-    rare = set(word) & RARE_LETTERS
-    if rare:
-        letters = ", ".join(sorted(rare))
+    suffixes, prefixes, _, _ = analyze_word(word)
+    for pre in prefixes[:1]:
+        parts.append(f"begins with the prefix {pre}-")
+    for suf in suffixes[:1]:
+        parts.append(f"ends with the suffix -{suf}")
+    word_mask = 0
+    for ch in word:
+        i = ord(ch) - 65
+        if 0 <= i < 26:
+            word_mask |= 1 << i
+    rare_mask = word_mask & RARE_MASK
+    if rare_mask:
+        rare = [LETTERS[i] for i in range(26) if rare_mask >> i & 1]
+        letters = ", ".join(rare)
         if len(rare) == 1:
             parts.append(f"uses the rare letter {letters}")
         else:
@@ -64,129 +235,176 @@ def explain_choice(word: str) -> str:
         parts.append("is the longest or clearest word I see")
     return "It " + "; ".join(parts)
 
-def build_morph_cot(puzzle: str,
-                       solution: Sequence[str],
-                       unused: int,
-                       zipf_scores: Optional[Sequence[float]] = None) -> str:
-    """Generate a step-by-step CoT, listing clues before naming each word."""
-    puzzle = puzzle.upper()
-    pool = Counter(puzzle)
-    lines: List[str] = []
-    lines.append(f"### Rack: `{puzzle}`")
-    lines.append("---")
+def precompute_zipf(words: Iterable[str]) -> Dict[str, float]:
+    """Zipf frequency of every stem/base :func:`build_morph_cot` may check for *words*."""
+    if zipf_frequency is None:
+        return {}
+    bases = set()
+    for word in words:
+        w = word.upper()
+        suffixes, prefixes, _, _ = analyze_word(w)
+        bases.update(w[:-len(s)] for s in suffixes)
+        bases.update(w[len(p):] for p in prefixes)
+        bases.update(w[len(p):-len(s)] for p in prefixes for s in suffixes)
+    return {b: zipf_frequency(b, 'en') for b in {b.lower() for b in bases if b}}
+
+def _base_zipf(base: str, zipf_table: Optional[Dict[str, float]]) -> float:
+    if zipf_table is not None:
+        return zipf_table.get(base.lower(), 0.0)
+    return zipf_frequency(base.lower(), 'en') if zipf_frequency is not None else 0.0
 
-    VOWELS = set("AEIOU")
+def iter_morph_cot(puzzle: str,
+                   solution: Sequence[str],
+                   unused: int,
+                   zipf_scores: Optional[Sequence[float]] = None,
+                   check_bases: bool = False,
+                   zipf_table: Optional[Dict[str, float]] = None,
+                   trusted: bool = False) -> Iterator[str]:
+    """
+    Yield the CoT of :func:`build_morph_cot` piece by piece.
+
+    Each piece is one or more whole lines, newline-terminated except the
+    last, so they can be written straight to a file as they come.
+    """
+    puzzle = puzzle.upper()
+    pool = letter_counts(puzzle)
+    sorted_letters = rack_letters(pool)   # re-rendered only when pool shrinks
+    yield f"{_HDR_RACK}`{puzzle}`\n---\n"
 
     for idx, word in enumerate(solution, start=1):
         w = word.upper()
-        lines.append(f"\n**Step {idx}:**")
-
         # 1) Alphabetize rack
-        sorted_letters = " ".join(sorted(pool.elements()))
-        lines.append(f"- Alphabetize rack: {sorted_letters}")
+        yield f"\n{_STEP_HDR}{idx}:**\n{_LBL_ALPHA}{sorted_letters}\n"
 
         # Collect clues
         clues_found = []
 
         # 2) Small words (len<=2)
         if len(w) <= 2:
-            letters = ", ".join(list(w))
-            lines.append(f"- I see the letters {letters} -> that spells the word '{w}'")
-            lines.append(f"- '{w}' is a common word")
+            letters = ", ".join(w)
+            yield f"- I see the letters {letters} -> that spells the word '{w}'\n"
+            yield f"- '{w}' is a common word\n"
         else:
+            suffix, prefix, vowel_pairs, clusters = scan_clues(w, pool, trusted)
+
             # 3) Suffix
-            suffix = next((s for s in COMMON_SUFFIXES if w.endswith(s)
-                           and all(pool[c] > 0 for c in s)), None)
             if suffix:
-                letters = ", ".join(suffix)
-                lines.append(f"- I see the letters {letters} -> suffix '-{suffix}'")
+                letters = SPELLED[suffix]
+                yield f"- I see the letters {letters} -> suffix '-{suffix}'\n"
                 clues_found.append('suffix')
 
             # 4) Prefix
-            prefix = next((p for p in COMMON_PREFIXES if w.startswith(p)
-                           and all(pool[c] > 0 for c in p)), None)
             if prefix:
-                letters = ", ".join(prefix)
-                lines.append(f"- I see the letters {letters} -> prefix '{prefix}-'")
+                letters = SPELLED[prefix]
+                yield f"- I see the letters {letters} -> prefix '{prefix}-'\n"
                 clues_found.append('prefix')
 
             # 5) Vowel pairs
-            vowel_pairs = [w[i:i+2] for i in range(len(w)-1)
-                           if {w[i], w[i+1]} <= VOWELS
-                           and all(pool[c] > 0 for c in w[i:i+2])]
             for vp in vowel_pairs:
-                letters = ", ".join(vp)
-                lines.append(f"- I also notice the vowel pair '{vp}' ({letters})")
+                letters = SPELLED[vp]
+                yield f"- I also notice the vowel pair '{vp}' ({letters})\n"
                 clues_found.append('vowel')
 
             # 6) Root/stem breakdown
             if suffix and prefix:
                 stem = w[len(prefix):-len(suffix)]
-                lines.append(
-                    f"- The stem is '{stem}' between prefix '{prefix}-' and suffix '-{suffix}'"
-                )
+                yield f"- The stem is '{stem}' between prefix '{prefix}-' and suffix '-{suffix}'\n"
                 # Stem validation via Zipf frequency
-                if zipf_frequency is not None and stem:
-                    z = zipf_frequency(stem.lower(), 'en')
+                if check_bases and stem:
+                    z = _base_zipf(stem, zipf_table)
                     if z > 3.0:
-                        # lines.append(f"- '{stem}' is also a valid word (Zipf freq {z:.2f})")
+                        # yield f"- '{stem}' is also a valid word (Zipf freq {z:.2f})\n"
                         pass
             elif suffix:
                 base = w[:-len(suffix)]
-                lines.append(f"- Removing suffix '-{suffix}' leaves base '{base}'")
+                yield f"- Removing suffix '-{suffix}' leaves base '{base}'\n"
                 # Base validation via Zipf frequency
-                if zipf_frequency is not None and base:
-                    z = zipf_frequency(base.lower(), 'en')
+                if check_bases and base:
+                    z = _base_zipf(base, zipf_table)
                     if z > 3.0:
-                        # lines.append(f"- '{base}' is also a valid word (Zipf freq {z:.2f})")
+                        # yield f"- '{base}' is also a valid word (Zipf freq {z:.2f})\n"
                         pass
             elif prefix:
                 base = w[len(prefix):]
-                lines.append(f"- Removing prefix '{prefix}-' leaves base '{base}'")
+                yield f"- Removing prefix '{prefix}-' leaves base '{base}'\n"
                 # Base validation via Zipf frequency
-                if zipf_frequency is not None and base:
-                    z = zipf_frequency(base.lower(), 'en')
+                if check_bases and base:
+                    z = _base_zipf(base, zipf_table)
                     if z > 3.0:
-                        # lines.append(f"- '{base}' is also a valid word (Zipf freq {z:.2f})")
+                        # yield f"- '{base}' is also a valid word (Zipf freq {z:.2f})\n"
                         pass
             # 6) Consonant-cluster detection
-            for cluster in CLUSTERS:
-                if cluster in w and all(pool.get(c, 0) > 0 for c in cluster):
-                    lines.append(f"- I also notice the consonant cluster '{cluster}'")
-                    clues_found.append('cluster')
+            for cluster in clusters:
+                yield f"- I also notice the consonant cluster '{cluster}'\n"
+                clues_found.append('cluster')
 
             # 7) Fallback if no morphological clue
             if not clues_found:
                 reason = explain_choice(w)
-                lines.append(f"- {reason}.")
-
-        # 7) Name the word
-        lines.append(f"- So I form the word '{w}'")
+                yield f"- {reason}.\n"
 
-        # 8) Show letters used
-        before_md = pool_to_markdown(pool, highlight=list(w))
-        lines.append(f"- Rack before using letters: {before_md}")
+        # 7-8) Name the word, show letters used; render the leftovers too
+        before_md, sorted_letters = render_before_after(pool, letter_counts(w))
+        yield f"{_LBL_FORM}'{w}'\n{_LBL_BEFORE}{before_md}\n"
 
-        # Consume letters
+        # Consume letters (a rack count never drops below zero)
         for ch in w:
-            pool[ch] -= 1
-            if pool[ch] == 0:
-                del pool[ch]
+            i = ord(ch) - 65
+            if 0 <= i < 26:
+                if pool[i]:
+                    pool[i] -= 1
+            elif pool.extra[ch]:
+                pool.extra[ch] -= 1
 
-        # 9) Show leftovers
-        after_md = pool_to_markdown(pool)
-        lines.append(f"- Letters left: {after_md}")
-
-        # 10) Prompt human next step
-        lines.append("- What should I do next?")
+        # 9-10) Show leftovers (they also open the next step's alphabetized
+        # rack), prompt human next step
+        yield f"{_LBL_LEFT}{sorted_letters or _NONE}\n{_LBL_NEXT}\n"
 
     # Final summary
     if unused:
-        lines.append(f"**Left-over letters:** {pool_to_markdown(pool)}")
+        yield f"{_LBL_LEFTOVER}{sorted_letters or _NONE}"
     else:
-        lines.append("**All letters placed - none left over!**")
+        yield "**All letters placed - none left over!**"
+
+def build_morph_cot(puzzle: str,
+                       solution: Sequence[str],
+                       unused: int,
+                       zipf_scores: Optional[Sequence[float]] = None,
+                       check_bases: bool = False,
+                       zipf_table: Optional[Dict[str, float]] = None,
+                       trusted: bool = False) -> str:
+    """
+    Generate a step-by-step CoT, listing clues before naming each word.
+
+    With *check_bases* the stem/base left after removing affixes is looked
+    up by Zipf frequency (in *zipf_table*, see :func:`precompute_zipf`, if
+    given); the lookup does not change the text yet, so it is off by default.
+    Pass *trusted* when every *solution* word is known to be buildable from
+    the letters left after the words before it (e.g. solver output); clue
+    letters then need no rack checks.
+    """
+    return "".join(iter_morph_cot(puzzle, solution, unused, zipf_scores,
+                                  check_bases, zipf_table, trusted))
+
+def _build_row(kwargs: dict, row: Sequence) -> str:
+    return build_morph_cot(*row, **kwargs)
 
-    return "\n".join(lines)
+def build_morph_cot_batch(rows: Iterable[Sequence],
+                          num_proc: Optional[int] = None,
+                          chunksize: int = 64,
+                          **kwargs) -> List[str]:
+    """
+    Run :func:`build_morph_cot` over *rows* of ``(puzzle, solution, unused[,
+    zipf_scores])`` across *num_proc* processes (default: all CPUs but one).
+    Keyword arguments (e.g. ``trusted=True``) are passed to every row.
+    Results keep the order of *rows*.
+    """
+    build_row = partial(_build_row, kwargs)
+    num_proc = num_proc or max(1, (os.cpu_count() or 1) - 1)
+    if num_proc == 1:
+        return [build_row(row) for row in rows]
+    with ProcessPoolExecutor(max_workers=num_proc) as pool:
+        return list(pool.map(build_row, rows, chunksize=chunksize))
 
 if __name__ == '__main__':
     # simple CLI wrap
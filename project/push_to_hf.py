@@ -1,8 +1,20 @@
+import inspect
+import os
+
+# let the Xet transfer backend use all cores/bandwidth; read at import time
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+
 from datasets import load_from_disk
 
 ds = load_from_disk("word_puzzle_cot")    # → a DatasetDict(train/validation)
 
+# newer datasets releases can convert/upload the parquet shards in parallel
+parallel = {}
+if "num_proc" in inspect.signature(ds.push_to_hub).parameters:
+    parallel["num_proc"] = os.cpu_count()
+
 ds.push_to_hub(
   "eli-equals-mc-2/WordPuzzleDataset",
-  private=True
+  private=True,
+  **parallel,
 )